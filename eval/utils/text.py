@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable
 
 NORMALIZE_PATTERN = re.compile(
     r"""
@@ -13,22 +14,44 @@ NORMALIZE_PATTERN = re.compile(
     """,
     re.VERBOSE,
 )
+_WS_RE = re.compile(r"\s+")
+_TRAIL_DOTS_RE = re.compile(r"[.\s]+$")
+
+_SEPARATOR = "\x00"  # not whitespace and not touched by NORMALIZE_PATTERN
 
 
 def normalize(text: str) -> str:
     """Normalize text to align with reference transcripts."""
     cleaned = text.replace("\u00a0", " ").lower()
     cleaned = NORMALIZE_PATTERN.sub("", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()  # remove double spaces
-    while cleaned.endswith("."):
-        cleaned = cleaned[:-1].rstrip()
-    return cleaned
+    cleaned = _WS_RE.sub(" ", cleaned).strip()  # remove double spaces
+    return _TRAIL_DOTS_RE.sub("", cleaned)
+
+
+def normalize_many(texts: Iterable[str]) -> list[str]:
+    """Normalize a batch of texts with a single regex pass over the joined input."""
+    items = list(texts)
+    if not items:
+        return []
+    if any(_SEPARATOR in item for item in items):
+        # Splitting on the separator would no longer line up with the inputs.
+        return [normalize(item) for item in items]
+    joined = _SEPARATOR.join(items).replace("\u00a0", " ").lower()
+    joined = NORMALIZE_PATTERN.sub("", joined)
+    joined = _WS_RE.sub(" ", joined)
+    return [_TRAIL_DOTS_RE.sub("", part.strip()) for part in joined.split(_SEPARATOR)]
 
 
-__all__ = ["normalize", "NORMALIZE_PATTERN"]
+__all__ = ["normalize", "normalize_many", "NORMALIZE_PATTERN"]
 
 
 if __name__ == "__main__":  # simple inline regression checks
     assert normalize("Satelit. Start.") == "satelit start"
     assert normalize("Stálo 3.5 Kč.") == "stálo 3.5 kč"
     assert normalize("Finále bylo 3:2.") == "finále bylo 3:2"
+    assert normalize("Skóre 3. . .") == "skóre 3"
+    assert normalize_many(["Satelit. Start.", "Stálo 3.5 Kč."]) == [
+        "satelit start",
+        "stálo 3.5 kč",
+    ]
+    assert normalize_many(["a\x00b", "c"]) == ["a\x00b", "c"]
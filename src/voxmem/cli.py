@@ -3,14 +3,14 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import os
+import queue
 import sys
 import threading
 import time
-import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
 
 import typer
 from dotenv import load_dotenv
@@ -28,7 +28,13 @@ from rich.progress import (
 
 from .csv_store import CsvRow, CsvStore
 from .storage import StorageResult, TranscriptStorage
-from .transcription import AssemblyAIClient, AssemblyAIError, RateLimitEvent
+from .transcription import (
+    AssemblyAIClient,
+    AssemblyAIError,
+    PollPacer,
+    RateLimitEvent,
+    build_sdk_client,
+)
 
 
 console = Console()
@@ -85,9 +91,48 @@ def build_progress(total: int, skipped: int) -> Progress:
         TimeRemainingColumn(),
         console=console,
         transient=False,
+        refresh_per_second=4,
     )
 
 
+class StatusPrinter:
+    """Print per-row status lines from a background thread.
+
+    Lines queued while a print is in progress are joined into a single
+    `console.print`, so a burst of finished rows costs one redraw of the
+    live progress bar instead of one per row.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self._console = console
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="status-printer", daemon=True
+        )
+
+    def __enter__(self) -> StatusPrinter:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def print(self, line: str) -> None:
+        self._queue.put(line)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get())
+            lines = [line for line in batch if line is not None]
+            if lines:
+                self._console.print("\n".join(lines))
+            if len(lines) != len(batch):
+                return
+
+
 def require_api_key() -> str:
     api_key = os.environ.get("ASSEMBLYAI_API_KEY", "").strip()
     if not api_key:
@@ -113,7 +158,7 @@ def handle_rate_limit(event: RateLimitEvent, logger: logging.Logger) -> None:
 
 def process_row(
     row: CsvRow,
-    client_factory,
+    clients: queue.Queue[AssemblyAIClient],
     storage: TranscriptStorage,
     logger: logging.Logger,
 ) -> WorkerResult:
@@ -123,9 +168,12 @@ def process_row(
     if not row.url:
         raise AssemblyAIError(f"{filename}: missing URL")
 
-    client = client_factory()
     start = time.monotonic()
-    result = client.transcribe(row.url)
+    client = clients.get()
+    try:
+        result = client.transcribe(row.url)
+    finally:
+        clients.put(client)
     transcription_id = result.transcription_id
 
     storage_result = storage.save_bundle(
@@ -155,6 +203,41 @@ def process_row(
     )
 
 
+def iter_completed(
+    submit: Callable[[CsvRow], Future],
+    rows: Iterable[CsvRow],
+    *,
+    max_in_flight: int,
+) -> Iterator[tuple[Future, CsvRow]]:
+    """Submit rows lazily and yield (future, row) pairs as they finish.
+
+    At most `max_in_flight` futures exist at any time, so memory stays
+    bounded by the worker count rather than the number of pending rows.
+    """
+    slots = threading.BoundedSemaphore(max_in_flight)
+    finished: queue.SimpleQueue[Future] = queue.SimpleQueue()
+    in_flight: dict[Future, CsvRow] = {}
+
+    def on_done(future: Future) -> None:
+        slots.release()
+        finished.put(future)
+
+    for row in rows:
+        while not slots.acquire(blocking=False):
+            future = finished.get()
+            yield future, in_flight.pop(future)
+        future = submit(row)
+        in_flight[future] = row
+        future.add_done_callback(on_done)
+        while not finished.empty():
+            future = finished.get()
+            yield future, in_flight.pop(future)
+
+    while in_flight:
+        future = finished.get()
+        yield future, in_flight.pop(future)
+
+
 def _extract_audio_duration(payload: Mapping[str, Any]) -> float | None:
     value = payload.get("audio_duration") if isinstance(payload, dict) else None
     try:
@@ -196,7 +279,28 @@ def run(
     poll_interval: float = typer.Option(
         2.0,
         "--poll-interval",
-        help="Seconds to wait between polling AssemblyAI",
+        help="Initial seconds to wait between polling AssemblyAI",
+    ),
+    max_poll_interval: float = typer.Option(
+        8.0,
+        "--max-poll-interval",
+        help="Upper bound for the exponentially growing polling interval",
+    ),
+    max_polls_per_second: float = typer.Option(
+        5.0,
+        "--max-polls-per-second",
+        min=0.1,
+        help="Cap on status requests per second across all workers",
+    ),
+    include_words: bool = typer.Option(
+        True,
+        "--include-words/--no-include-words",
+        help="Keep word-level timings in the saved JSON payload",
+    ),
+    pretty_json: bool = typer.Option(
+        False,
+        "--pretty-json",
+        help="Indent the saved JSON payloads (compact by default)",
     ),
     logfile: Optional[str] = typer.Option(
         None,
@@ -227,21 +331,28 @@ def run(
         )
         raise typer.Exit(code=0)
 
-    storage = TranscriptStorage(output)
+    storage = TranscriptStorage(output, pretty=pretty_json)
     rate_limit_callback = lambda event: handle_rate_limit(event, logger)
-    thread_local: threading.local = threading.local()
-
-    def client_factory() -> AssemblyAIClient:
-        client = getattr(thread_local, "client", None)
-        if client is None:
-            client = AssemblyAIClient(
+    # Each worker can have a VTT and an SRT export in flight at once.
+    sdk_client = build_sdk_client(api_key, pool_size=workers * 2)
+    poll_pacer = PollPacer(max_polls_per_second)
+    # One SRT export per worker can run alongside that worker's VTT export.
+    export_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tx-export")
+    clients: queue.Queue[AssemblyAIClient] = queue.Queue()
+    for _ in range(min(workers, len(pending))):
+        clients.put(
+            AssemblyAIClient(
                 api_key=api_key,
                 poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
                 timeout=float(timeout),
+                include_words=include_words,
                 on_rate_limit=rate_limit_callback,
+                sdk_client=sdk_client,
+                poll_pacer=poll_pacer,
+                export_pool=export_pool,
             )
-            thread_local.client = client
-        return client
+        )
 
     console.print(
         f"Processing {len(pending)} row(s) (skipping {skipped}) from {csv_path}"
@@ -271,15 +382,14 @@ def run(
 
     start_time = time.monotonic()
 
-    with progress:
+    with store, progress, StatusPrinter(console) as printer, export_pool:
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_map = {
-                executor.submit(process_row, row, client_factory, storage, logger): row
-                for row in pending
-            }
-
-            for future in as_completed(future_map):
-                row = future_map[future]
+            submit = lambda row: executor.submit(
+                process_row, row, clients, storage, logger
+            )
+            for future, row in iter_completed(
+                submit, pending, max_in_flight=workers * 2
+            ):
                 try:
                     result = future.result()
                 except Exception as exc:  # pragma: no cover - runtime errors
@@ -288,9 +398,7 @@ def run(
                     filename = row.filename or f"row #{row.index}"
                     exc_name = type(exc).__name__
                     detail = _exc_summary(exc)
-                    console.print(
-                        f"{state} {filename} [dim]{exc_name}: {detail}[/dim]"
-                    )
+                    printer.print(f"{state} {filename} [dim]{exc_name}: {detail}[/dim]")
                     errors.append(f"{filename}: {exc}")
                     logger.error(
                         "failed filename=%s error=%s location=%s detail=%s",
@@ -311,9 +419,7 @@ def run(
                     f"• {format_duration(result.audio_duration)} in "
                     f"{format_duration(result.duration)}"
                 )
-                console.print(
-                    f"{state} {result.filename} [dim]{detail}[/dim]"
-                )
+                printer.print(f"{state} {result.filename} [dim]{detail}[/dim]")
 
     total_duration = time.monotonic() - start_time
     summary = (
@@ -353,11 +459,9 @@ def _last_trace_location(exc: BaseException) -> str:
     tb = exc.__traceback__
     if tb is None:
         return "unknown"
-    frames = traceback.extract_tb(tb)
-    if not frames:
-        return "unknown"
-    last = frames[-1]
-    return f"{last.filename}:{last.lineno}"
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return f"{tb.tb_frame.f_code.co_filename}:{tb.tb_lineno}"
 
 
 def _exc_summary(exc: BaseException, limit: int = 60) -> str:
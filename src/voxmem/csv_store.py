@@ -1,82 +1,130 @@
 from __future__ import annotations
 
 import csv
+import io
+import json
 import os
+import queue
 import tempfile
+import time
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Sequence
+from threading import Lock, Thread
+from typing import IO, Mapping, Sequence
 
+from .util.fs import write_all
 from .util.path import normalize_to_dirname
 
 
 REQUIRED_COLUMNS = ("filename", "url")
 DEFAULT_COLUMNS = ("transcription_id", "status", "error")
+STRIPPED_COLUMNS = ("filename", "url", "transcription_id", "status")
 
 
 @dataclass(slots=True)
 class CsvRow:
+    """View of one CSV row: its cells plus the store's column-name index."""
+
     index: int
-    data: dict[str, str]
+    cells: list[str]
+    columns: Mapping[str, int]
 
+    # STRIPPED_COLUMNS are trimmed once when the store loads.
     @property
     def filename(self) -> str:
-        return self.data.get("filename", "").strip()
+        return self.cells[self.columns["filename"]]
 
     @property
     def url(self) -> str:
-        return self.data.get("url", "").strip()
+        return self.cells[self.columns["url"]]
 
     @property
     def transcription_id(self) -> str | None:
-        value = self.data.get("transcription_id", "").strip()
-        return value or None
+        return self.cells[self.columns["transcription_id"]] or None
 
     @property
     def status(self) -> str | None:
-        value = self.data.get("status", "").strip()
-        return value or None
+        return self.cells[self.columns["status"]] or None
 
     def is_completed(self) -> bool:
         return bool(self.transcription_id and (self.status == "completed"))
 
 
 class CsvStore:
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self, path: Path, *, flush_every: int = 16, flush_interval: float = 2.0
+    ) -> None:
         self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._journal_path = path.with_suffix(path.suffix + ".journal")
+        self._journal: IO[str] | None = None
+        self._dirty = 0
+        self._last_flush = time.monotonic()
         self._lock = Lock()
+        self._updates: queue.Queue[tuple[int, dict[str, str]] | None] = queue.Queue()
+        self._writer: Thread | None = None
+        self._writer_error: BaseException | None = None
         self.fieldnames: list[str]
-        self.rows: list[dict[str, str]]
+        self.rows: list[list[str]]
+        self._col_index: dict[str, int]
+        self._strip_at: list[int]
+        self._completed: list[bool]
         self._load()
+        if self._journal_path.exists():
+            self._replay_journal()
+
+    def __enter__(self) -> CsvStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _load(self) -> None:
         if not self.path.exists():
             raise FileNotFoundError(self.path)
 
         with self.path.open("r", newline="", encoding="utf-8") as fh:
-            reader = csv.DictReader(fh)
-            if not reader.fieldnames:
+            reader = csv.reader(fh)
+            header = next(reader, None)
+            if not header:
                 raise ValueError("CSV file is missing headers")
 
-            missing = [col for col in REQUIRED_COLUMNS if col not in reader.fieldnames]
+            missing = [col for col in REQUIRED_COLUMNS if col not in header]
             if missing:
                 raise ValueError(
                     f"CSV missing required columns: {', '.join(missing)}"
                 )
 
-            fieldnames = list(reader.fieldnames)
+            fieldnames = list(header)
             for col in DEFAULT_COLUMNS:
                 if col not in fieldnames:
                     fieldnames.append(col)
 
             self.fieldnames = fieldnames
-            self.rows = [self._ensure_defaults(row) for row in reader]
+            self._col_index = {col: i for i, col in enumerate(fieldnames)}
+            self._strip_at = [self._col_index[col] for col in STRIPPED_COLUMNS]
+            self.rows = [
+                self._fit_row(cells, len(header)) for cells in reader if cells
+            ]
+            self._completed = [self._is_completed(cells) for cells in self.rows]
 
-    def _ensure_defaults(self, row: dict[str, str]) -> dict[str, str]:
-        for col in DEFAULT_COLUMNS:
-            row.setdefault(col, "")
-        return row
+    def _fit_row(self, cells: list[str], header_width: int) -> list[str]:
+        # Cells past the header are dropped (as csv.DictReader did) before
+        # padding out any columns we appended.
+        del cells[header_width:]
+        cells.extend([""] * (len(self.fieldnames) - len(cells)))
+        for i in self._strip_at:
+            cells[i] = cells[i].strip()
+        return cells
+
+    def _is_completed(self, cells: list[str]) -> bool:
+        return bool(
+            cells[self._col_index["transcription_id"]]
+            and cells[self._col_index["status"]] == "completed"
+        )
 
     def slice(self, offset: int, limit: int | None) -> list[CsvRow]:
         if offset < 0:
@@ -84,58 +132,171 @@ class CsvStore:
 
         start = min(offset, len(self.rows))
         end = len(self.rows) if limit is None else min(start + max(limit, 0), len(self.rows))
-        return [CsvRow(index=i, data=self.rows[i]) for i in range(start, end)]
+        columns = self._col_index
+        return [
+            CsvRow(index=i, cells=self.rows[i], columns=columns)
+            for i in range(start, end)
+        ]
 
     def ensure_unique_filenames(self, rows: Sequence[CsvRow]) -> None:
-        seen: set[str] = set()
-        duplicates: set[str] = set()
+        keys: list[str] = []
         for row in rows:
-            name = row.filename
             try:
-                norm = normalize_to_dirname(name)
+                keys.append(_dirname_key(row.filename))
             except ValueError as exc:
                 raise ValueError(f"Row {row.index}: {exc}") from exc
-            key = norm.lower()
-            if key in seen:
-                duplicates.add(name or norm)
-            else:
-                seen.add(key)
 
+        counts = Counter(keys)
+        duplicates = {
+            row.filename for row, key in zip(rows, keys) if counts[key] > 1
+        }
         if duplicates:
             raise ValueError(
                 "Duplicate filenames detected: " + ", ".join(sorted(duplicates))
             )
 
     def pending(self, rows: Sequence[CsvRow]) -> list[CsvRow]:
-        return [row for row in rows if not row.is_completed()]
+        completed = self._completed
+        return [row for row in rows if not completed[row.index]]
 
     def mark_completed(self, index: int, transcription_id: str) -> None:
-        with self._lock:
-            entry = self.rows[index]
-            entry["transcription_id"] = transcription_id
-            entry["status"] = "completed"
-            entry["error"] = ""
-            self._flush_locked()
+        self._submit(
+            index,
+            {"transcription_id": transcription_id, "status": "completed", "error": ""},
+        )
 
     def mark_failed(self, index: int, message: str) -> None:
+        self._submit(index, {"status": "error", "error": message[:500]})
+
+    def flush(self) -> None:
+        """Rewrite the CSV with all journaled updates and drop the journal."""
+        if self._writer is not None:
+            self._updates.join()
+        self._raise_writer_error()
         with self._lock:
-            entry = self.rows[index]
-            entry.setdefault("transcription_id", "")
-            entry["status"] = "error"
-            entry["error"] = message[:500]
+            self._compact_locked()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._updates.put(None)
+                self._writer.join()
+                self._writer = None
+
+    def _submit(self, index: int, values: dict[str, str]) -> None:
+        # Updates are applied, journaled and compacted on a dedicated writer
+        # thread so callers never wait on disk I/O.
+        self._raise_writer_error()
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = Thread(
+                        target=self._writer_loop, name="csv-writer", daemon=True
+                    )
+                    self._writer.start()
+        self._updates.put((index, values))
+
+    def _writer_loop(self) -> None:
+        while True:
+            update = self._updates.get()
+            try:
+                if update is None:
+                    return
+                if self._writer_error is not None:
+                    continue
+                index, values = update
+                with self._lock:
+                    self._set_locked(index, **values)
+                    self._journal_locked(index)
+            except BaseException as exc:  # surfaced on the next call
+                self._writer_error = exc
+            finally:
+                self._updates.task_done()
+
+    def _raise_writer_error(self) -> None:
+        if self._writer_error is not None:
+            raise RuntimeError(
+                f"Failed to record CSV update: {self._writer_error}"
+            ) from self._writer_error
+
+    def _set_locked(self, index: int, **values: str) -> None:
+        cells = self.rows[index]
+        for col, value in values.items():
+            cells[self._col_index[col]] = value
+        self._completed[index] = self._is_completed(cells)
+
+    def _journal_locked(self, index: int) -> None:
+        if self._journal is None:
+            self._journal = self._journal_path.open(
+                "a", encoding="utf-8", buffering=1
+            )
+        cells = self.rows[index]
+        record = {col: cells[self._col_index[col]] for col in DEFAULT_COLUMNS}
+        record["index"] = index
+        self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._dirty += 1
+        if (
+            self._dirty >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._dirty:
             self._flush_locked()
+        self._journal_path.unlink(missing_ok=True)
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+
+    def _replay_journal(self) -> None:
+        # Recover updates from a run that ended before close(); a torn
+        # trailing line from a crash is ignored.
+        with self._journal_path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                index = record.get("index")
+                if not isinstance(index, int) or not 0 <= index < len(self.rows):
+                    continue
+                self._set_locked(
+                    index, **{col: str(record.get(col) or "") for col in DEFAULT_COLUMNS}
+                )
+                self._dirty += 1
+        self.flush()
 
     def _flush_locked(self) -> None:
+        # Render the whole file with the C csv writer, encode it once and
+        # hand it to the kernel in a single write.
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer)
+        writer.writerow(self.fieldnames)
+        writer.writerows(self.rows)
+        data = buffer.getvalue().encode("utf-8")
+
         tmp_fd, tmp_path = tempfile.mkstemp(
             dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
         )
         try:
-            with os.fdopen(tmp_fd, "w", newline="", encoding="utf-8") as fh:
-                writer = csv.DictWriter(fh, fieldnames=self.fieldnames)
-                writer.writeheader()
-                for row in self.rows:
-                    writer.writerow({key: row.get(key, "") for key in self.fieldnames})
+            try:
+                write_all(tmp_fd, data)
+            finally:
+                os.close(tmp_fd)
             os.replace(tmp_path, self.path)
-        finally:
-            if os.path.exists(tmp_path):
+        except BaseException:
+            try:
                 os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+
+@lru_cache(maxsize=None)
+def _dirname_key(name: str) -> str:
+    return normalize_to_dirname(name).lower()
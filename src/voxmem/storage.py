@@ -3,13 +3,25 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from .util.fs import write_all
 from .util.path import normalize_to_dirname
 
 
+# Shared by all storages: a bundle's artifacts are independent files, so
+# their writes (and optional fsyncs) can overlap.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tx-io")
+
+
 @dataclass(slots=True)
 class StorageResult:
     folder: Path
@@ -19,8 +31,18 @@ class StorageResult:
 
 
 class TranscriptStorage:
-    def __init__(self, root: Path, file_mode: int = 0o644) -> None:
+    def __init__(
+        self,
+        root: Path,
+        file_mode: int = 0o644,
+        *,
+        pretty: bool = False,
+        durable: bool = False,
+    ) -> None:
         self.root = root
+        self.file_mode = file_mode
+        self.pretty = pretty
+        self.durable = durable
         self.root.mkdir(parents=True, exist_ok=True)
 
     def save_bundle(
@@ -33,9 +55,14 @@ class TranscriptStorage:
         srt: str | None = None,
     ) -> StorageResult:
         folder = self._ensure_folder(filename)
-        json_path = self._write_json(folder / f"{transcription_id}.json", payload)
-        vtt_path = self._write_text(folder / f"{transcription_id}.vtt", vtt)
-        srt_path = self._write_text(folder / f"{transcription_id}.srt", srt)
+        json_future = _IO_POOL.submit(
+            self._write_json, folder / f"{transcription_id}.json", payload
+        )
+        vtt_future = self._submit_text(folder / f"{transcription_id}.vtt", vtt)
+        srt_future = self._submit_text(folder / f"{transcription_id}.srt", srt)
+        json_path = json_future.result()
+        vtt_path = vtt_future.result() if vtt_future is not None else None
+        srt_path = srt_future.result() if srt_future is not None else None
         return StorageResult(
             folder=folder, json_path=json_path, vtt_path=vtt_path, srt_path=srt_path
         )
@@ -46,25 +73,58 @@ class TranscriptStorage:
         folder.mkdir(parents=True, exist_ok=True)
         return folder
 
+    def _submit_text(self, target: Path, content: str | None) -> Future | None:
+        if content is None:
+            return None
+        return _IO_POOL.submit(self._write_text, target, content)
+
     def _write_json(self, target: Path, payload: Mapping[str, Any]) -> Path:
-        self._atomic_write(target, json.dumps(payload, ensure_ascii=False, indent=2))
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if self.pretty:
+                option |= orjson.OPT_INDENT_2
+            self._atomic_write(target, orjson.dumps(payload, option=option))
+        else:
+            self._atomic_write_with(
+                target, lambda fd: _dump_json(payload, fd, pretty=self.pretty)
+            )
         return target
 
     def _write_text(self, target: Path, content: str | None) -> Path | None:
         if content is None:
             return None
-        self._atomic_write(target, content)
+        self._atomic_write(target, content.encode("utf-8"))
         return target
 
-    def _atomic_write(self, target: Path, data: str) -> None:
+    def _atomic_write(self, target: Path, data: bytes) -> None:
+        self._atomic_write_with(target, lambda fd: write_all(fd, data))
+
+    def _atomic_write_with(self, target: Path, write: Callable[[int], object]) -> None:
         tmp_fd, tmp_path = tempfile.mkstemp(
             dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
         )
         try:
-            with os.fdopen(tmp_fd, "w", encoding="utf-8") as fh:
-                fh.write(data)
-            os.chmod(tmp_path, self.file_mode)
+            try:
+                write(tmp_fd)
+                os.fchmod(tmp_fd, self.file_mode)
+                if self.durable:
+                    os.fsync(tmp_fd)
+            finally:
+                os.close(tmp_fd)
             os.replace(tmp_path, target)
-        finally:
-            if os.path.exists(tmp_path):
+        except BaseException:
+            try:
                 os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+
+def _dump_json(payload: Mapping[str, Any], fd: int, *, pretty: bool) -> None:
+    # Stream the encoder's chunks into the file instead of building the
+    # whole document as one string first.
+    with os.fdopen(fd, "w", encoding="utf-8", closefd=False) as text:
+        if pretty:
+            json.dump(payload, text, ensure_ascii=False, indent=2)
+        else:
+            json.dump(payload, text, ensure_ascii=False, separators=(",", ":"))
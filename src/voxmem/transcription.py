@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 import datetime as dt
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import random
+import threading
 import time
 from typing import Any, Callable
 
 import assemblyai as aai
+import httpx
 from assemblyai import api as aai_api
-from assemblyai.types import AssemblyAIError as SDKError, TranscriptResponse, TranscriptStatus
+from assemblyai.types import AssemblyAIError as SDKError, TranscriptStatus
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+_COMPLETED = TranscriptStatus.completed.value
+_ERROR = TranscriptStatus.error.value
+_POLL_JITTER = 0.5
+_KEEPALIVE_EXPIRY = 60.0
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+_RATE_LIMIT_JITTER = 1.0
+# Processing usually takes a fraction of the audio length; when the API
+# reports the duration early, the first wait is stretched to match.
+_EXPECTED_PROCESSING_RATIO = 0.3
 
 
 class AssemblyAIError(RuntimeError):
@@ -23,6 +46,37 @@ class RateLimitEvent:
     reset_at: dt.datetime | None
 
 
+@dataclass(slots=True)
+class _ParsedRateLimit:
+    """Rate-limit headers of one 429 response, parsed once."""
+
+    retry_after: float | None
+    reset_at: float | None  # epoch seconds, a wall-clock value
+    limit: int | None
+    remaining: int | None
+
+    @classmethod
+    def from_response(cls, response) -> _ParsedRateLimit:
+        headers = response.headers if response is not None else {}
+        # Both headers may also be HTTP-dates (RFC 7231).
+        retry_after = headers.get("Retry-After")
+        retry_delay = _safe_float(retry_after)
+        if retry_delay is None:
+            retry_at = _http_date(retry_after)
+            if retry_at is not None:
+                retry_delay = retry_at - time.time()
+        reset = headers.get("X-RateLimit-Reset")
+        reset_at = _safe_float(reset)
+        if reset_at is None:
+            reset_at = _http_date(reset)
+        return cls(
+            retry_after=retry_delay,
+            reset_at=reset_at,
+            limit=_safe_int(headers.get("X-RateLimit-Limit")),
+            remaining=_safe_int(headers.get("X-RateLimit-Remaining")),
+        )
+
+
 @dataclass(slots=True)
 class TranscriptData:
     transcription_id: str
@@ -31,16 +85,90 @@ class TranscriptData:
     srt: str
 
 
+def build_sdk_client(
+    api_key: str, *, request_timeout: float = 30.0, pool_size: int = 10
+) -> aai.Client:
+    """Create an SDK client backed by an HTTP/2 pool shared by all workers."""
+    settings = aai.settings.copy()
+    settings.api_key = api_key
+    settings.http_timeout = request_timeout
+    client = aai.Client(settings=settings)
+
+    # The SDK offers no hook for transport options, so rebuild its httpx
+    # client with the same base URL, headers and event hooks (which feed
+    # `last_response`) and swap it in.
+    default = client.http_client
+    client._http_client = httpx.Client(
+        base_url=default.base_url,
+        headers=default.headers,
+        timeout=default.timeout,
+        event_hooks=default.event_hooks,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        ),
+    )
+    default.close()
+    return client
+
+
+class PollPacer:
+    """Spaces status polls from any number of clients to at most `rate`/s.
+
+    AssemblyAI has no multi-transcript status endpoint, so every pending
+    job still needs its own GET; sharing one pacer keeps the total request
+    rate flat however many jobs are in flight.
+    """
+
+    __slots__ = ("interval", "_next", "_lock")
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("Poll rate must be positive")
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, deadline: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(_within(slot - now, deadline))
+
+
 class AssemblyAIClient:
+    __slots__ = (
+        "poll_interval",
+        "max_poll_interval",
+        "timeout",
+        "max_retries",
+        "include_words",
+        "_on_rate_limit",
+        "_poll_pacer",
+        "_export_pool",
+        "_rng",
+        "_client",
+        "_transcriber",
+    )
+
     def __init__(
         self,
         api_key: str,
         *,
         poll_interval: float = 2.0,
+        max_poll_interval: float = 8.0,
         timeout: float | None = 3600.0,
         request_timeout: float = 30.0,
         max_retries: int = 5,
+        include_words: bool = True,
         on_rate_limit: Callable[[RateLimitEvent], None] | None = None,
+        sdk_client: aai.Client | None = None,
+        poll_pacer: PollPacer | None = None,
+        export_pool: Executor | None = None,
     ) -> None:
         if not api_key:
             raise AssemblyAIError("Missing ASSEMBLYAI_API_KEY")
@@ -50,151 +178,284 @@ class AssemblyAIClient:
         aai.settings.http_timeout = request_timeout
 
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
         self.timeout = timeout
         self.max_retries = max_retries
+        self.include_words = include_words
         self._on_rate_limit = on_rate_limit
+        self._poll_pacer = poll_pacer
+        self._export_pool = export_pool
+        # Per-client RNG so concurrent workers draw independent jitter.
+        self._rng = random.Random()
 
-        self._client = aai.Client.get_default()
+        self._client = sdk_client or aai.Client.get_default()
         self._transcriber = aai.Transcriber(
-            client=self._client,
-            config=aai.TranscriptionConfig(
-                speaker_labels=True,
-                format_text=True,
-                punctuate=True,
-                language_detection=True,
-                speech_model=aai.SpeechModel.universal,
-            ),
+            client=self._client, config=_transcription_config()
         )
 
     def transcribe(self, url: str) -> TranscriptData:
-        submission = self._retry(lambda: self._transcriber.submit(url))
+        submission = self._retry(lambda: self._transcriber.submit(url), idempotent=False)
         transcript_id = submission.id
         if not transcript_id:
             raise AssemblyAIError("AssemblyAI response missing transcript id")
 
-        start = time.monotonic()
+        monotonic = time.monotonic
+        sleep = time.sleep
+        pacer = self._poll_pacer
+        timeout = self.timeout
+        start = monotonic()
+        deadline = start + timeout if timeout is not None else None
         last_status: str | None = None
+        attempt = 0
+        waited_for_audio = False
 
         while True:
-            if self.timeout is not None and (time.monotonic() - start) > self.timeout:
+            if deadline is not None and monotonic() >= deadline:
                 raise TimeoutError(
-                    f"Timed out after {self.timeout:.0f}s (transcript {transcript_id}, last status: {last_status or 'unknown'})"
+                    f"Timed out after {timeout:.0f}s (transcript {transcript_id}, last status: {last_status or 'unknown'})"
                 )
 
-            response = self._fetch_transcript(transcript_id)
-            status = response.status.value if isinstance(response.status, TranscriptStatus) else str(response.status)
+            if pacer is not None:
+                pacer.wait(deadline)
+            raw = self._fetch_transcript(transcript_id, deadline)
+            status = raw.get("status")
+            if status != last_status:
+                attempt = 0
             last_status = status
 
-            if status == TranscriptStatus.completed.value:
-                data = response.dict()
-                vtt = self._export_vtt(transcript_id)
-                srt = self._export_srt(transcript_id)
+            if status == _COMPLETED:
+                if not self.include_words:
+                    _drop_words(raw)
+                vtt, srt = self._export_subtitles(transcript_id, deadline)
                 return TranscriptData(
                     transcription_id=transcript_id,
-                    payload=data,
+                    payload=raw,
                     vtt=vtt,
                     srt=srt,
                 )
 
-            if status == TranscriptStatus.error.value:
-                raise AssemblyAIError(response.error or "AssemblyAI error")
+            if status == _ERROR:
+                raise AssemblyAIError(raw.get("error") or "AssemblyAI error")
 
-            time.sleep(self.poll_interval)
+            delay = self._poll_delay(attempt)
+            if not waited_for_audio and raw.get("audio_duration"):
+                waited_for_audio = True
+                delay = max(delay, self._expected_wait(raw["audio_duration"], start))
+            sleep(_within(delay, deadline))
+            attempt += 1
 
-    def _fetch_transcript(self, transcript_id: str) -> TranscriptResponse:
+    def _fetch_transcript(
+        self, transcript_id: str, deadline: float | None = None
+    ) -> dict[str, Any]:
         return self._retry(
-            lambda: aai_api.get_transcript(self._client.http_client, transcript_id)
+            lambda: self._get_transcript_json(transcript_id), deadline=deadline
         )
 
-    def _export_vtt(self, transcript_id: str) -> str:
+    def _get_transcript_json(self, transcript_id: str) -> dict[str, Any]:
+        # The decoded JSON is used as-is, both for status checks and as the
+        # saved payload; building the SDK's pydantic model and dumping it
+        # back to a dict is pure overhead on large transcripts.
+        response = self._client.http_client.get(
+            f"{aai_api.ENDPOINT_TRANSCRIPT}/{transcript_id}"
+        )
+        if response.status_code != httpx.codes.OK:
+            raise SDKError(
+                f"failed to retrieve transcript {transcript_id}: {response.text}",
+                response.status_code,
+            )
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _export_subtitles(
+        self, transcript_id: str, deadline: float | None
+    ) -> tuple[str, str]:
+        # The SRT export runs on another thread while this one fetches the
+        # VTT, so the two round-trips overlap. Callers running many clients
+        # share one pool sized to their worker count.
+        if self._export_pool is None:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                srt_future = pool.submit(self._export_srt, transcript_id, deadline)
+                vtt = self._export_vtt(transcript_id, deadline)
+                return vtt, srt_future.result()
+        srt_future = self._export_pool.submit(self._export_srt, transcript_id, deadline)
+        vtt = self._export_vtt(transcript_id, deadline)
+        return vtt, srt_future.result()
+
+    def _export_vtt(self, transcript_id: str, deadline: float | None = None) -> str:
         return self._retry(
             lambda: aai_api.export_subtitles_vtt(
                 client=self._client.http_client,
                 transcript_id=transcript_id,
                 chars_per_caption=None,
-            )
+            ),
+            deadline=deadline,
         )
 
-    def _export_srt(self, transcript_id: str) -> str:
+    def _export_srt(self, transcript_id: str, deadline: float | None = None) -> str:
         return self._retry(
             lambda: aai_api.export_subtitles_srt(
                 client=self._client.http_client,
                 transcript_id=transcript_id,
                 chars_per_caption=None,
-            )
+            ),
+            deadline=deadline,
         )
 
-    def _retry(self, func: Callable[[], Any]) -> Any:
+    def _retry(
+        self,
+        func: Callable[[], Any],
+        *,
+        idempotent: bool = True,
+        deadline: float | None = None,
+    ) -> Any:
+        # `deadline` is on the time.monotonic() clock; retry sleeps never
+        # run past it. Non-idempotent calls (submitting a job) are only
+        # retried when the request cannot have been accepted: a 429 or a
+        # failed connect. A 5xx or timeout may already have created a
+        # transcript, and retrying would start (and bill) a duplicate.
         for attempt in range(1, self.max_retries + 1):
             try:
                 return func()
             except SDKError as exc:
+                # The SDK client is shared by all workers, so last_response
+                # may belong to another thread's request; the status comes
+                # from the exception and the response is only trusted for
+                # headers when it agrees.
+                status = exc.status_code
                 response = self._client.last_response
-                status = getattr(response, "status_code", None)
-                if status in {429, 500, 502, 503, 504}:
-                    delay = self._rate_limit_delay(response, attempt)
-                    if status == 429 and self._on_rate_limit and response is not None:
+                if getattr(response, "status_code", None) != status:
+                    response = None
+                if status == 429:
+                    _check_deadline(deadline, exc)
+                    parsed = _ParsedRateLimit.from_response(response)
+                    delay = _within(self._rate_limit_delay(parsed, attempt), deadline)
+                    if self._on_rate_limit and response is not None:
                         endpoint = response.request.url.path if response.request else "unknown"
-                        self._on_rate_limit(self._rate_limit_event(endpoint, delay, response))
+                        self._on_rate_limit(self._rate_limit_event(endpoint, delay, parsed))
                     time.sleep(delay)
                     continue
+                if idempotent and status in {500, 502, 503, 504}:
+                    _check_deadline(deadline, exc)
+                    time.sleep(_within(self._backoff_delay(attempt), deadline))
+                    continue
                 raise AssemblyAIError(str(exc)) from exc
             except Exception as exc:  # pragma: no cover - unexpected errors
-                if attempt == self.max_retries:
+                retryable = idempotent or isinstance(exc, httpx.ConnectError)
+                if not retryable or attempt == self.max_retries:
                     raise AssemblyAIError(str(exc)) from exc
-                time.sleep(self._backoff_delay(attempt))
+                _check_deadline(deadline, exc)
+                time.sleep(_within(self._backoff_delay(attempt), deadline))
 
         raise AssemblyAIError("Maximum retries exceeded")
 
-    @staticmethod
-    def _backoff_delay(attempt: int) -> float:
-        return min(2**attempt, 30)
-
-    def _rate_limit_delay(self, response, attempt: int) -> float:
-        if response is not None:
-            retry_after = response.headers.get("Retry-After")
-            if retry_after:
-                try:
-                    return max(float(retry_after), 1.0)
-                except ValueError:
-                    pass
-
-            reset = response.headers.get("X-RateLimit-Reset")
-            if reset:
-                try:
-                    reset_at = float(reset)
-                    return max(reset_at - time.time(), 1.0)
-                except ValueError:
-                    pass
-
-        return self._backoff_delay(attempt)
-
-    def _rate_limit_event(self, endpoint: str, delay: float, response) -> RateLimitEvent:
-        headers = response.headers if response is not None else {}
-        limit = self._safe_int(headers.get("X-RateLimit-Limit"))
-        remaining = self._safe_int(headers.get("X-RateLimit-Remaining"))
-
+    def _poll_delay(self, attempt: int) -> float:
+        # The exponent is clamped: attempt keeps growing through a long
+        # processing phase, and a huge 2**attempt overflows float math.
+        delay = min(self.poll_interval * 2 ** min(attempt, 16), self.max_poll_interval)
+        return delay + self._rng.uniform(0, _POLL_JITTER)
+
+    def _expected_wait(self, audio_duration: float, start: float) -> float:
+        wait = _EXPECTED_PROCESSING_RATIO * float(audio_duration)
+        if self.timeout is not None:
+            wait = min(wait, self.timeout - (time.monotonic() - start))
+        return wait
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Full jitter: spread retries over the whole window so workers that
+        # failed together do not retry together.
+        return self._rng.uniform(0, min(_BACKOFF_BASE * 2**attempt, _BACKOFF_CAP))
+
+    def _rate_limit_delay(self, parsed: _ParsedRateLimit, attempt: int) -> float:
+        if parsed.retry_after is not None:
+            delay = parsed.retry_after
+        elif parsed.reset_at is not None:
+            # The reset header is a wall-clock epoch, so compare it with
+            # time.time(); the result is only a duration from here on.
+            delay = parsed.reset_at - time.time()
+        else:
+            return self._backoff_delay(attempt)
+        delay = min(max(delay, 1.0), _BACKOFF_CAP)
+        return delay + self._rng.uniform(0, _RATE_LIMIT_JITTER)
+
+    def _rate_limit_event(
+        self, endpoint: str, delay: float, parsed: _ParsedRateLimit
+    ) -> RateLimitEvent:
         reset_dt: dt.datetime | None = None
-        reset = headers.get("X-RateLimit-Reset")
-        if reset:
+        if parsed.reset_at is not None:
             try:
-                reset_dt = dt.datetime.fromtimestamp(float(reset), tz=dt.timezone.utc)
-            except ValueError:
+                reset_dt = dt.datetime.fromtimestamp(parsed.reset_at, tz=dt.timezone.utc)
+            except (OverflowError, OSError, ValueError):
                 reset_dt = None
 
         return RateLimitEvent(
             endpoint=endpoint,
             delay=delay,
-            limit=limit,
-            remaining=remaining,
+            limit=parsed.limit,
+            remaining=parsed.remaining,
             reset_at=reset_dt,
         )
 
-    @staticmethod
-    def _safe_int(value: str | None) -> int | None:
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return None
+
+def _within(delay: float, deadline: float | None) -> float:
+    if deadline is None:
+        return delay
+    return min(delay, max(deadline - time.monotonic(), 0.0))
+
+
+def _check_deadline(deadline: float | None, exc: BaseException) -> None:
+    # Once the deadline has passed, a zero-length sleep would just fire the
+    # remaining retries back to back; give up instead.
+    if deadline is not None and time.monotonic() >= deadline:
+        raise TimeoutError(f"Deadline passed while retrying: {exc}") from exc
+
+
+def _safe_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _safe_float(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed.timestamp()
+
+
+@lru_cache(maxsize=1)
+def _transcription_config() -> aai.TranscriptionConfig:
+    # The SDK only reads the config when submitting, so every client (one
+    # per worker) can share a single instance.
+    return aai.TranscriptionConfig(
+        speaker_labels=True,
+        format_text=True,
+        punctuate=True,
+        language_detection=True,
+        speech_model=aai.SpeechModel.universal,
+    )
+
+
+def _drop_words(payload: dict[str, Any]) -> None:
+    """Remove word-level timings in place (top level and per utterance)."""
+    payload.pop("words", None)
+    for utterance in payload.get("utterances") or ():
+        if isinstance(utterance, dict):
+            utterance["words"] = []
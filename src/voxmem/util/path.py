@@ -5,23 +5,42 @@ import unicodedata
 from pathlib import Path
 
 
-_SAFE_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+_SAFE_PATTERN = re.compile(r"[^A-Za-z0-9._-]+", re.ASCII)
+
+
+class _AsciiTable(dict):
+    """str.translate table mapping each code point to its ASCII fold.
+
+    Entries are filled in on first use, so a character pays for NFKD and
+    the ASCII encode once per process rather than once per name.
+    """
+
+    def __missing__(self, codepoint: int) -> str | None:
+        folded = unicodedata.normalize("NFKD", chr(codepoint))
+        folded = folded.encode("ascii", "ignore").decode("ascii").replace(" ", "_")
+        self[codepoint] = value = folded or None
+        return value
+
+
+_ASCII_TABLE = _AsciiTable()
 
 
 def normalize_to_dirname(name: str, max_length: int = 100) -> str:
     if not name:
         raise ValueError("Filename must be provided for normalization")
 
-    filename = Path(name).name.strip()
+    filename = _basename(name).strip()
     if not filename:
         raise ValueError("Filename must contain at least one visible character")
 
-    stem = Path(filename).stem.strip()
+    stem = _stem(filename).strip()
     candidate = stem or filename
 
-    candidate = unicodedata.normalize("NFKD", candidate)
-    candidate = candidate.encode("ascii", "ignore").decode("ascii")
-    candidate = candidate.replace(" ", "_")
+    if candidate.isascii():
+        # Already-ASCII names (the common case) only need spaces mapped.
+        candidate = candidate.replace(" ", "_")
+    else:
+        candidate = candidate.translate(_ASCII_TABLE)
     candidate = _SAFE_PATTERN.sub("_", candidate)
     candidate = candidate.strip("._-")
 
@@ -32,3 +51,19 @@ def normalize_to_dirname(name: str, max_length: int = 100) -> str:
         candidate = candidate[:max_length]
 
     return candidate
+
+
+def _basename(name: str) -> str:
+    # Same result as Path(name).name without building a Path; the rare
+    # names ending in a "." component go through Path for its semantics.
+    base = name.rstrip("/").rpartition("/")[2]
+    if base == ".":
+        return Path(name).name
+    return base
+
+
+def _stem(filename: str) -> str:
+    i = filename.rfind(".")
+    if 0 < i < len(filename) - 1:
+        return filename[:i]
+    return filename
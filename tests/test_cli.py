@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from voxmem.cli import iter_completed
+from voxmem.csv_store import CsvRow
+
+
+def test_iter_completed_bounds_in_flight_futures() -> None:
+    rows = [CsvRow(index=i, cells=[f"{i}.mp3"], columns={"filename": 0}) for i in range(50)]
+    max_in_flight = 3
+    lock = threading.Lock()
+    # Nothing finishes until the limit has been reached.
+    limit_reached = threading.Event()
+    running = 0
+    peak_running = 0
+    submitted = 0
+
+    def work(row: CsvRow) -> int:
+        nonlocal running
+        assert limit_reached.wait(timeout=5)
+        with lock:
+            running -= 1
+        return row.index
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+
+        def submit(row: CsvRow):
+            nonlocal running, peak_running, submitted
+            with lock:
+                submitted += 1
+                running += 1
+                peak_running = max(peak_running, running)
+                if running >= max_in_flight:
+                    limit_reached.set()
+            return executor.submit(work, row)
+
+        seen = []
+        outstanding = []
+        for future, row in iter_completed(submit, rows, max_in_flight=max_in_flight):
+            assert future.result() == row.index
+            outstanding.append(submitted - len(seen))
+            seen.append(row.index)
+
+    assert sorted(seen) == list(range(50))
+    # The pool has spare threads, so only iter_completed caps the work.
+    assert peak_running == max_in_flight
+    assert outstanding[0] == max_in_flight
+
+
+def test_last_trace_location_points_at_raising_frame() -> None:
+    from voxmem.cli import _last_trace_location
+
+    def inner() -> None:
+        raise ValueError("boom")
+
+    try:
+        inner()
+    except ValueError as exc:
+        location = _last_trace_location(exc)
+
+    assert location == f"{__file__}:{inner.__code__.co_firstlineno + 1}"
+    assert _last_trace_location(ValueError("never raised")) == "unknown"
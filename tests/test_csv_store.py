@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from voxmem.csv_store import CsvStore
+
+
+def write_csv(path: Path, rows: list[dict[str, str]]) -> Path:
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def read_csv(path: Path) -> list[dict[str, str]]:
+    with path.open(newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    return write_csv(
+        tmp_path / "samples.csv",
+        [
+            {"filename": "a.mp3", "url": "https://example.com/a.mp3"},
+            {"filename": "b.mp3", "url": "https://example.com/b.mp3"},
+        ],
+    )
+
+
+def test_close_writes_updates(csv_path: Path) -> None:
+    with CsvStore(csv_path) as store:
+        store.mark_completed(0, "tid-a")
+        store.mark_failed(1, "boom")
+
+    rows = read_csv(csv_path)
+    assert rows[0]["transcription_id"] == "tid-a"
+    assert rows[0]["status"] == "completed"
+    assert rows[1]["status"] == "error"
+    assert rows[1]["error"] == "boom"
+    assert not csv_path.with_suffix(".csv.journal").exists()
+
+
+def test_journal_is_replayed_after_crash(csv_path: Path) -> None:
+    store = CsvStore(csv_path)
+    store.mark_completed(1, "tid-b")
+    store._updates.join()
+    # Simulate a crash: the journal is never compacted into the CSV.
+    store._journal.close()
+
+    recovered = CsvStore(csv_path)
+
+    assert [row.index for row in recovered.pending(recovered.slice(0, None))] == [0]
+    assert read_csv(csv_path)[1]["transcription_id"] == "tid-b"
+    assert not csv_path.with_suffix(".csv.journal").exists()
+
+
+def test_missing_required_columns(tmp_path: Path) -> None:
+    path = write_csv(tmp_path / "bad.csv", [{"filename": "a.mp3"}])
+    with pytest.raises(ValueError, match="url"):
+        CsvStore(path)
+
+
+def test_duplicate_filenames_are_rejected(tmp_path: Path) -> None:
+    path = write_csv(
+        tmp_path / "dups.csv",
+        [
+            {"filename": "dir/A.mp3", "url": "u1"},
+            {"filename": "a.wav", "url": "u2"},
+        ],
+    )
+    store = CsvStore(path)
+    with pytest.raises(ValueError, match="Duplicate filenames detected: a.wav, dir/A.mp3"):
+        store.ensure_unique_filenames(store.slice(0, None))
+
+
+def test_unusable_filename_reports_row(tmp_path: Path) -> None:
+    path = write_csv(tmp_path / "bad.csv", [{"filename": "!!!", "url": "u1"}])
+    store = CsvStore(path)
+    with pytest.raises(ValueError, match="Row 0"):
+        store.ensure_unique_filenames(store.slice(0, None))
+
+
+def test_updates_are_flushed_in_batches(csv_path: Path) -> None:
+    store = CsvStore(csv_path, flush_every=2, flush_interval=3600)
+
+    store.mark_completed(0, "tid-a")
+    store._updates.join()
+    assert "transcription_id" not in read_csv(csv_path)[0]
+
+    store.mark_completed(1, "tid-b")
+    store._updates.join()
+    assert [row["transcription_id"] for row in read_csv(csv_path)] == ["tid-a", "tid-b"]
+    assert not csv_path.with_suffix(".csv.journal").exists()
+
+
+def test_known_cells_are_stripped_on_load(tmp_path: Path) -> None:
+    path = tmp_path / "padded.csv"
+    path.write_text("filename,url,status,note\n a.mp3 , https://a , completed , keep \n")
+
+    (row,) = CsvStore(path).slice(0, None)
+
+    assert (row.filename, row.url, row.status) == ("a.mp3", "https://a", "completed")
+    assert row.cells[3] == " keep "
+
+
+def test_pending_tracks_completed_rows(tmp_path: Path) -> None:
+    path = write_csv(
+        tmp_path / "mixed.csv",
+        [
+            {"filename": "a.mp3", "url": "u", "transcription_id": "t", "status": "completed"},
+            {"filename": "b.mp3", "url": "u", "transcription_id": "", "status": "completed"},
+            {"filename": "c.mp3", "url": "u", "transcription_id": "t", "status": "error"},
+        ],
+    )
+    store = CsvStore(path)
+    assert [row.index for row in store.pending(store.slice(0, None))] == [1, 2]
+
+    store.mark_completed(2, "tid-c")
+    store.flush()
+
+    assert [row.index for row in store.pending(store.slice(0, None))] == [1]
+    store.close()
+
+
+def test_writer_errors_surface_on_flush(csv_path: Path, monkeypatch) -> None:
+    store = CsvStore(csv_path)
+
+    def fail(_index: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_journal_locked", fail)
+    store.mark_completed(0, "tid-a")
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        store.close()
+    assert store._writer is None
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from voxmem.storage import TranscriptStorage
+
+
+def test_save_bundle_writes_all_artifacts(tmp_path: Path) -> None:
+    storage = TranscriptStorage(tmp_path)
+    payload = {"id": "abc", "text": "Žluťoučký kůň", "words": [{"start": 0, "end": 1}]}
+
+    result = storage.save_bundle("Žluťoučký kůň.mp3", "abc", payload, vtt="WEBVTT", srt="1")
+
+    assert result.folder == tmp_path / "Zlutoucky_kun"
+    assert json.loads(result.json_path.read_text(encoding="utf-8")) == payload
+    assert result.vtt_path is not None and result.vtt_path.read_text() == "WEBVTT"
+    assert result.srt_path is not None and result.srt_path.read_text() == "1"
+    assert not list(result.folder.glob("*.tmp"))
+
+
+def test_save_bundle_skips_missing_subtitles(tmp_path: Path) -> None:
+    storage = TranscriptStorage(tmp_path)
+
+    result = storage.save_bundle("audio.mp3", "abc", {"id": "abc"})
+
+    assert result.vtt_path is None
+    assert result.srt_path is None
+    assert sorted(p.name for p in result.folder.iterdir()) == ["abc.json"]
+
+
+def test_json_fallback_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    from voxmem import storage as storage_module
+
+    monkeypatch.setattr(storage_module, "orjson", None)
+    storage = TranscriptStorage(tmp_path)
+
+    result = storage.save_bundle("audio.mp3", "abc", {"text": "kůň"})
+
+    assert json.loads(result.json_path.read_text(encoding="utf-8")) == {"text": "kůň"}
+
+
+def test_json_is_compact_unless_pretty(tmp_path: Path) -> None:
+    compact = TranscriptStorage(tmp_path / "compact").save_bundle("a.mp3", "x", {"a": [1]})
+    pretty = TranscriptStorage(tmp_path / "pretty", pretty=True).save_bundle(
+        "a.mp3", "x", {"a": [1]}
+    )
+
+    assert compact.json_path.read_text() == '{"a":[1]}'
+    assert "\n" in pretty.json_path.read_text()
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path: Path) -> None:
+    storage = TranscriptStorage(tmp_path)
+
+    def explode(_fh) -> None:
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        storage._atomic_write_with(tmp_path / "out.json", explode)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_mode_and_durable_write(tmp_path: Path) -> None:
+    storage = TranscriptStorage(tmp_path, file_mode=0o600, durable=True)
+
+    result = storage.save_bundle("audio.mp3", "abc", {"id": "abc"}, vtt="WEBVTT")
+
+    assert result.json_path.stat().st_mode & 0o777 == 0o600
+    assert result.vtt_path is not None and result.vtt_path.read_text() == "WEBVTT"
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import email.utils
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from voxmem import transcription
+from voxmem.transcription import AssemblyAIClient
+
+
+def make_client(**kwargs) -> AssemblyAIClient:
+    return AssemblyAIClient(api_key="test-key", **kwargs)
+
+
+def install_transport(client: AssemblyAIClient, handler) -> list[httpx.Request]:
+    requests: list[httpx.Request] = []
+    sdk_client = client._client
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    def store(response: httpx.Response) -> None:
+        sdk_client._last_response = response
+
+    sdk_client._http_client = httpx.Client(
+        base_url=sdk_client.settings.base_url,
+        transport=httpx.MockTransport(record),
+        event_hooks={"response": [store]},
+    )
+    return requests
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(transcription.time, "sleep", lambda _seconds: None)
+
+
+def test_poll_delay_grows_exponentially() -> None:
+    client = make_client(poll_interval=1.0, max_poll_interval=8.0)
+    assert 1.0 <= client._poll_delay(0) <= 1.5
+    assert 4.0 <= client._poll_delay(2) <= 4.5
+
+
+def test_poll_delay_is_capped() -> None:
+    client = make_client(poll_interval=1.0, max_poll_interval=8.0)
+    assert 8.0 <= client._poll_delay(10) <= 8.5
+
+
+def test_poll_delay_survives_very_long_polling() -> None:
+    client = make_client(poll_interval=1.0, max_poll_interval=8.0)
+    assert 8.0 <= client._poll_delay(5000) <= 8.5
+
+
+def test_transcribe_polls_until_completed() -> None:
+    client = make_client()
+    statuses = iter(["queued", "processing", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "status": "queued", "audio_url": "u"})
+        if path.endswith("/vtt"):
+            return httpx.Response(200, text="WEBVTT")
+        if path.endswith("/srt"):
+            return httpx.Response(200, text="1")
+        return httpx.Response(
+            200,
+            json={"id": "t1", "status": next(statuses), "audio_url": "u", "text": "hello"},
+        )
+
+    requests = install_transport(client, handler)
+    result = client.transcribe("https://example.com/a.mp3")
+
+    assert result.transcription_id == "t1"
+    assert result.payload["text"] == "hello"
+    assert (result.vtt, result.srt) == ("WEBVTT", "1")
+    polls = [r for r in requests if r.url.path == "/v2/transcript/t1"]
+    assert len(polls) == 3
+
+
+def test_subtitle_exports_use_the_shared_pool() -> None:
+    submitted: list[object] = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(fn)
+            return super().submit(fn, *args, **kwargs)
+
+    with RecordingPool(max_workers=1) as pool:
+        client = make_client(export_pool=pool)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/vtt"):
+                return httpx.Response(200, text="WEBVTT")
+            return httpx.Response(200, text="1")
+
+        install_transport(client, handler)
+        assert client._export_subtitles("t1", None) == ("WEBVTT", "1")
+
+    assert submitted == [client._export_srt]
+
+
+def test_transcribe_can_drop_words() -> None:
+    client = make_client(include_words=False)
+    word = {"text": "hi", "start": 0, "end": 10, "confidence": 0.9}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "status": "queued", "audio_url": "u"})
+        if request.url.path.endswith(("/vtt", "/srt")):
+            return httpx.Response(200, text="")
+        return httpx.Response(
+            200,
+            json={
+                "id": "t1",
+                "status": "completed",
+                "audio_url": "u",
+                "text": "hi",
+                "words": [word],
+                "utterances": [dict(word, speaker="A", words=[word])],
+            },
+        )
+
+    install_transport(client, handler)
+    result = client.transcribe("https://example.com/a.mp3")
+
+    assert result.payload["text"] == "hi"
+    assert not result.payload.get("words")
+    assert not result.payload["utterances"][0].get("words")
+
+
+def test_transcribe_raises_on_error_status() -> None:
+    client = make_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "status": "queued", "audio_url": "u"})
+        return httpx.Response(
+            200, json={"id": "t1", "status": "error", "audio_url": "u", "error": "bad audio"}
+        )
+
+    install_transport(client, handler)
+    with pytest.raises(transcription.AssemblyAIError, match="bad audio"):
+        client.transcribe("https://example.com/a.mp3")
+
+
+def test_build_sdk_client_uses_http2_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    originals: list[httpx.Client] = []
+
+    class RecordingClient(transcription.aai.Client):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            originals.append(self.http_client)
+
+    monkeypatch.setattr(transcription.aai, "Client", RecordingClient)
+    sdk_client = transcription.build_sdk_client("test-key", pool_size=3)
+
+    http_client = sdk_client.http_client
+    (original,) = originals
+    assert http_client is not original
+    assert original.is_closed
+    pool = http_client._transport._pool
+    assert pool._http2
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 3
+    assert http_client.headers["authorization"] == "test-key"
+    assert http_client.event_hooks["response"]
+    assert make_client(sdk_client=sdk_client)._client is sdk_client
+
+
+def test_backoff_delay_uses_full_jitter() -> None:
+    client = make_client()
+    delays = [client._backoff_delay(3) for _ in range(200)]
+    assert all(0.0 <= delay <= 8.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert all(0.0 <= client._backoff_delay(20) <= 30.0 for _ in range(50))
+
+
+def test_server_errors_are_retried_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client(max_retries=3)
+    monkeypatch.setattr(AssemblyAIClient, "_rate_limit_delay", pytest.fail)
+    responses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(responses)
+        if status != 200:
+            return httpx.Response(status, text="unavailable")
+        return httpx.Response(200, json={"id": "tid", "status": "queued"})
+
+    install_transport(client, handler)
+    assert client._fetch_transcript("tid")["status"] == "queued"
+
+
+def test_first_wait_scales_with_audio_duration(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client(poll_interval=1.0, max_poll_interval=4.0)
+    sleeps: list[float] = []
+    monkeypatch.setattr(transcription.time, "sleep", sleeps.append)
+    statuses = iter(["processing", "processing", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "status": "queued", "audio_url": "u"})
+        if request.url.path.endswith(("/vtt", "/srt")):
+            return httpx.Response(200, text="")
+        return httpx.Response(
+            200,
+            json={"id": "t1", "status": next(statuses), "audio_url": "u", "audio_duration": 600},
+        )
+
+    install_transport(client, handler)
+    client.transcribe("https://example.com/a.mp3")
+
+    assert sleeps[0] == pytest.approx(180.0)
+    assert sleeps[1] < 4.0
+
+
+def test_clients_share_transcription_config() -> None:
+    first, second = make_client(), make_client()
+    assert first._transcriber.config is second._transcriber.config
+    assert first._transcriber.config.speaker_labels
+
+
+def test_rate_limit_delay_is_clamped_and_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[transcription.RateLimitEvent] = []
+    client = make_client(on_rate_limit=events.append)
+    sleeps: list[float] = []
+    monkeypatch.setattr(transcription.time, "sleep", sleeps.append)
+    responses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if next(responses) == 429:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": "120", "X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0"},
+                text="slow down",
+            )
+        return httpx.Response(200, json={"id": "tid", "status": "queued"})
+
+    install_transport(client, handler)
+    client._fetch_transcript("tid")
+
+    (event,) = events
+    assert 30.0 <= event.delay <= 31.0
+    assert (event.limit, event.remaining, event.reset_at) == (5, 0, None)
+    assert sleeps == [event.delay]
+
+
+def test_retry_sleep_stops_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client()
+    sleeps: list[float] = []
+    monkeypatch.setattr(transcription.time, "sleep", sleeps.append)
+    responses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if next(responses) == 429:
+            return httpx.Response(429, headers={"Retry-After": "20"}, text="slow down")
+        return httpx.Response(200, json={"id": "tid", "status": "queued"})
+
+    install_transport(client, handler)
+    client._fetch_transcript("tid", transcription.time.monotonic() + 5.0)
+
+    assert 0.0 < sleeps[0] <= 5.0
+
+
+def test_submit_is_not_retried_on_server_error() -> None:
+    client = make_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, text="bad gateway")
+
+    requests = install_transport(client, handler)
+    with pytest.raises(transcription.AssemblyAIError):
+        client.transcribe("https://example.com/a.mp3")
+
+    assert [r.method for r in requests] == ["POST"]
+
+
+def test_submit_ignores_other_threads_last_response() -> None:
+    client = make_client()
+    sdk_client = client._client
+    requests = install_transport(client, lambda request: httpx.Response(502, text="bad gateway"))
+    # Another worker's 429 lands in the shared client's last_response.
+    other = httpx.Response(429, headers={"Retry-After": "1"})
+    sdk_client.http_client.event_hooks = {
+        "response": [lambda response: setattr(sdk_client, "_last_response", other)]
+    }
+
+    with pytest.raises(transcription.AssemblyAIError):
+        client.transcribe("https://example.com/a.mp3")
+
+    assert [r.method for r in requests] == ["POST"]
+
+
+def test_rate_limit_headers_accept_http_dates() -> None:
+    client = make_client()
+    retry_at = transcription.time.time() + 10
+    response = httpx.Response(
+        429,
+        headers={
+            "Retry-After": email.utils.formatdate(retry_at, usegmt=True),
+            "X-RateLimit-Reset": email.utils.formatdate(retry_at, usegmt=True),
+        },
+    )
+    parsed = transcription._ParsedRateLimit.from_response(response)
+
+    assert 8.0 <= client._rate_limit_delay(parsed, 1) <= 11.0
+    event = client._rate_limit_event("/v2/transcript", 10.0, parsed)
+    assert event.reset_at is not None
+    assert abs(event.reset_at.timestamp() - retry_at) <= 1.0
+
+
+def test_poll_pacer_spaces_callers(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    sleeps: list[float] = []
+    monkeypatch.setattr(transcription.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(transcription.time, "sleep", sleeps.append)
+    pacer = transcription.PollPacer(rate=4.0)
+
+    for _ in range(3):
+        pacer.wait()
+
+    assert sleeps == [0.25, 0.5]
+
+
+def test_retry_gives_up_once_deadline_has_passed() -> None:
+    client = make_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "10"}, text="slow down")
+
+    requests = install_transport(client, handler)
+    with pytest.raises(TimeoutError):
+        client._fetch_transcript("tid", transcription.time.monotonic() - 1.0)
+
+    assert len(requests) == 1
+
+
+def test_poll_sleep_stops_at_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = make_client(poll_interval=8.0, max_poll_interval=8.0, timeout=3.0)
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(transcription.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(transcription.time, "sleep", sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "t1", "status": "queued", "audio_url": "u"})
+        return httpx.Response(200, json={"id": "t1", "status": "processing", "audio_url": "u"})
+
+    install_transport(client, handler)
+    with pytest.raises(TimeoutError):
+        client.transcribe("https://example.com/a.mp3")
+
+    assert sleeps == [3.0]
@@ -13,10 +13,19 @@ def test_strips_directories() -> None:
     assert normalize_to_dirname("../weird/audio.mp3") == "audio"
 
 
+def test_trailing_separators_and_dot_components() -> None:
+    assert normalize_to_dirname("dir/audio.mp3/") == "audio"
+    assert normalize_to_dirname("dir/audio.mp3/./") == "audio"
+
+
 def test_unicode_and_spaces() -> None:
     assert normalize_to_dirname("Žluťoučký kůň.mp3") == "Zlutoucky_kun"
 
 
+def test_compatibility_characters_are_folded() -> None:
+    assert normalize_to_dirname("ﬁnal\u00a0take½.mp3") == "final_take12"
+
+
 def test_symbols_are_replaced() -> None:
     assert normalize_to_dirname("foo*?bar.mp3") == "foo_bar"
 